@@ -23,7 +23,7 @@ from numbers import Number
 from typing import List, Optional, Union
 
 from basin3d.core import monitor
-from basin3d.core.schema.enum import FeatureTypeEnum, FEATURE_SHAPE_TYPES, MappedAttributeEnum, MAPPING_DELIMITER, NO_MAPPING_TEXT
+from basin3d.core.schema.enum import FeatureTypeEnum, FEATURE_TYPE_SHAPES, MappedAttributeEnum, MAPPING_DELIMITER, NO_MAPPING_TEXT
 from basin3d.core.translate import get_datasource_mapped_attribute, translate_attributes
 from basin3d.core.types import SpatialSamplingShapes
 
@@ -1024,9 +1024,9 @@ class SpatialSamplingFeature(SamplingFeature):
         self.__validate__()
 
         # Set the shape dependent on feature_type
-        for key, values in FEATURE_SHAPE_TYPES.items():
-            if self.feature_type in values:
-                self.shape = key
+        shape = FEATURE_TYPE_SHAPES.get(self.feature_type)
+        if shape:
+            self.shape = shape
 
     def __validate__(self):
         """
@@ -13,13 +13,14 @@
 
 
 """
+from collections import OrderedDict
 from types import MethodType
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 from basin3d.core import monitor
 from basin3d.core.catalog import CatalogSqlAlchemy
 from basin3d.core.models import DataSource
-from basin3d.core.schema.enum import FeatureTypeEnum
+from basin3d.core.schema.enum import FeatureTypeEnum, MAPPING_DELIMITER
 
 logger = monitor.get_logger(__name__)
 
@@ -43,11 +44,44 @@ def get_feature_type(feature_type, return_format="enum"):
     return None
 
 
+class _LRUCache(OrderedDict):
+    """
+    Cache of catalog lookups that keeps up to `maxsize` of the most recently used lookups.
+    The lookups are keyed by query vocabularies, which are user supplied, so the cache must be bounded.
+    """
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get_or_set(self, key, lookup):
+        """
+        Get the cached value for the key. If it is not cached, call `lookup` for the value and cache it,
+        removing the least recently used value if the cache is full.
+
+        :param key: the cache key
+        :param lookup: function, without arguments, that returns the value to cache
+        :return: the value
+        """
+        if key in self:
+            self.move_to_end(key)
+            return self[key]
+
+        value = lookup()
+        self[key] = value
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+        return value
+
+
 class DataSourcePluginAccess:
     """
     Metaclass for DataSource plugin views.  The should be registered in a subclass of
     :class:`basin3d.plugins.DataSourcePluginPoint` in attribute `plugin_access_classes`.
     """
+
+    #: The maximum number of attribute mapping lookups cached
+    attribute_mapping_cache_size = 1024
+
     def __init__(self, datasource: DataSource, catalog: CatalogSqlAlchemy):
         """
 
@@ -57,10 +91,26 @@ class DataSourcePluginAccess:
         self._datasource = datasource
         self._catalog = catalog
 
+        self.clear_attribute_mapping_cache()
+
     @property
     def datasource(self):
         return self._datasource
 
+    def clear_attribute_mapping_cache(self):
+        """
+        Clear the cached attribute mapping lookups. The attribute mappings do not change once the catalog
+        is initialized so the most recent lookups, up to `attribute_mapping_cache_size`, are cached.
+        Clear the cache if the catalog mappings change.
+        """
+        # Attribute mapping lookups, keyed by (attr_type, attr_vocab, from_basin3d).
+        self._attribute_mappings = _LRUCache(self.attribute_mapping_cache_size)
+        self._compound_mappings: Optional[Dict[str, Tuple[str, ...]]] = None
+        self._compound_mapping_fields: Optional[List[str]] = None
+
+        # Datasource vocabulary lookups made for every model object created, keyed by (attr_type, attr_vocab)
+        self._datasource_attribute_mappings = _LRUCache(self.attribute_mapping_cache_size)
+
     def get_datasource_attribute_mapping(self, attr_type, attr_vocab):
         """
         Get attribute mapping for the specified attribute type and datasource attribute vocab
@@ -69,7 +119,13 @@ class DataSourcePluginAccess:
         :param attr_vocab: datasource attribute vocabulary
         :return: a `basin3d.models.AttributeMapping` object
         """
-        return self._catalog.find_datasource_attribute_mapping(self.datasource.id, attr_type, attr_vocab)
+        if not isinstance(attr_vocab, str):
+            return self._catalog.find_datasource_attribute_mapping(self.datasource.id, attr_type, attr_vocab)
+
+        # The same datasource vocabularies are translated for each model object, use the cached mapping if it exists
+        return self._datasource_attribute_mappings.get_or_set(
+            (attr_type, attr_vocab),
+            lambda: self._catalog.find_datasource_attribute_mapping(self.datasource.id, attr_type, attr_vocab))
 
     def get_attribute_mappings(self, attr_type=None, attr_vocab=None, from_basin3d=False):
         """
@@ -80,7 +136,42 @@ class DataSourcePluginAccess:
         :param from_basin3d:
         :return:
         """
-        return self._catalog.find_attribute_mappings(self.datasource.id, attr_type, attr_vocab, from_basin3d)
+        if attr_vocab is not None and not isinstance(attr_vocab, str):
+            return self._catalog.find_attribute_mappings(self.datasource.id, attr_type, attr_vocab, from_basin3d)
+
+        # The same mappings are searched for on every query translation, use the cached results if they exist.
+        # All searches, from BASIN-3D or datasource vocabularies, share the bounded cache.
+        return iter(self._attribute_mappings.get_or_set(
+            (attr_type, attr_vocab, from_basin3d),
+            lambda: tuple(self._catalog.find_attribute_mappings(self.datasource.id, attr_type, attr_vocab, from_basin3d))))
+
+    def get_compound_mappings(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Get the compound mappings for the datasource. The compound attribute types are split once
+        and shared by all of the translations.
+
+        :return: dictionary of the compound attribute types to the attribute types they are made of, in the
+                 order specified in the plugin mapping file.
+        """
+        if self._compound_mappings is None:
+            self._compound_mappings = {attr_mapping.attr_type: tuple(attr_mapping.attr_type.split(MAPPING_DELIMITER))
+                                       for attr_mapping in self.get_attribute_mappings()
+                                       if MAPPING_DELIMITER in attr_mapping.attr_type}
+        return self._compound_mappings
+
+    def get_compound_mapping_fields(self) -> List[str]:
+        """
+        Get the attributes, in lower case, that are part of a compound mapping for the datasource. The
+        order of the attributes is preserved as specified in the plugin mapping file. The order only
+        matters relative to the individual compound mapping. Attributes in more than one compound mapping
+        are listed once.
+
+        :return: list of the attributes that are part of a compound mapping, empty if there are none
+        """
+        if self._compound_mapping_fields is None:
+            self._compound_mapping_fields = list(dict.fromkeys(cm_attr.lower() for cm_attrs in self.get_compound_mappings().values()
+                                                               for cm_attr in cm_attrs))
+        return self._compound_mapping_fields
 
 
 def basin3d_plugin(cls):
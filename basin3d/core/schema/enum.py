@@ -112,6 +112,10 @@ FEATURE_SHAPE_TYPES = {
     SpatialSamplingShapes.SHAPE_SOLID: []
 }
 
+# The spatial sampling shape of each feature type, the reverse lookup of FEATURE_SHAPE_TYPES
+FEATURE_TYPE_SHAPES = {feature_type.value: shape for shape, feature_types in FEATURE_SHAPE_TYPES.items()
+                       for feature_type in feature_types}
+
 
 class ResultQualityEnum(str, BaseEnum):
     """Enumeration for Result Quality"""
@@ -14,7 +14,7 @@
 
 """
 from datetime import date
-from typing import ClassVar, List, Optional, Union
+from typing import ClassVar, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -64,11 +64,12 @@ class QueryBase(BaseModel):
         # Validate all fields when initialized
         validate_all = True
 
-    # Get the query fields that have mappings. Subclasses may overwrite this base function
-    mapped_fields: ClassVar[List[str]] = []
+    # Get the query fields that have mappings. Subclasses may overwrite this base function.
+    # These are tuples so that they can be shared by every query without being copied.
+    mapped_fields: ClassVar[Tuple[str, ...]] = ()
 
     # Get the query fields that have prefixes. Subclasses may overwrite ths base function
-    prefixed_fields: ClassVar[List[str]] = []
+    prefixed_fields: ClassVar[Tuple[str, ...]] = ()
 
 
 class QueryMonitoringFeature(QueryBase):
@@ -99,7 +100,7 @@ class QueryMonitoringFeature(QueryBase):
                 data[field] = isinstance(data[field], str) and data[field].upper() or data[field]
         super().__init__(**data)
 
-    prefixed_fields: ClassVar[List[str]] = ['id', 'monitoring_feature', 'parent_feature']
+    prefixed_fields: ClassVar[Tuple[str, ...]] = ('id', 'monitoring_feature', 'parent_feature')
 
 
 class QueryMeasurementTimeseriesTVP(QueryBase):
@@ -151,8 +152,8 @@ class QueryMeasurementTimeseriesTVP(QueryBase):
 
     # observed_property_variables is first b/c it is most likely to have compound mappings.
     # ToDo: check how order may affect translation (see core/synthesis)
-    mapped_fields: ClassVar[List[str]] = ['observed_property', 'aggregation_duration', 'statistic', 'result_quality', 'sampling_medium']
-    prefixed_fields: ClassVar[List[str]] = ['monitoring_feature']
+    mapped_fields: ClassVar[Tuple[str, ...]] = ('observed_property', 'aggregation_duration', 'statistic', 'result_quality', 'sampling_medium')
+    prefixed_fields: ClassVar[Tuple[str, ...]] = ('monitoring_feature',)
 
 
 class SynthesisMessage(BaseModel):
@@ -13,23 +13,44 @@
 
 """
 import logging
-from typing import Iterator, List, Optional
+from typing import Dict, Generator, Iterator, List, NamedTuple, Optional
 
 from basin3d.core import monitor
-from basin3d.core.models import Base, MeasurementTimeseriesTVPObservation, MonitoringFeature
+from basin3d.core.models import Base, DataSource, MeasurementTimeseriesTVPObservation, MonitoringFeature
 from basin3d.core.plugin import DataSourcePluginAccess, DataSourcePluginPoint
 from basin3d.core.schema.enum import MessageLevelEnum, AggregationDurationEnum
 from basin3d.core.schema.query import QueryBase, QueryMeasurementTimeseriesTVP, \
     QueryMonitoringFeature, SynthesisMessage, SynthesisResponse
-from basin3d.core.translate import translate_query
+from basin3d.core.translate import has_datasource_values, translate_query
 
 logger = monitor.get_logger(__name__)
 
+#: The logging level for each synthesis message level
+_LOGGER_LEVELS = {MessageLevelEnum.CRITICAL: logging.CRITICAL,
+                  MessageLevelEnum.ERROR: logging.ERROR,
+                  MessageLevelEnum.WARN: logging.WARNING}
+
+
+class PluginMeta(NamedTuple):
+    """
+    The data source plugin metadata used to synthesize a BASIN-3D model
+    """
+    plugin: DataSourcePluginPoint
+    datasource: DataSource
+    #: The plugin view for the synthesis model, None if the plugin does not support it
+    plugin_view: Optional[DataSourcePluginAccess]
+    #: True if the plugin view has a callable list method
+    supports_list: bool
+    #: True if the plugin view has a callable get method
+    supports_get: bool
+
 
 class MonitorMixin(object):
     """
     Adds monitor log functionality to a class for logging synthesis messages
     """
+    __slots__ = ()
+
     def log(self,
             message: str, level: Optional[MessageLevelEnum] = None, where: Optional[List] = None) -> Optional[SynthesisMessage]:
         """
@@ -42,10 +63,13 @@ class MonitorMixin(object):
         logger_level = logging.INFO
         synthesis_message = None
         if level:
-            logger_level = level == MessageLevelEnum.CRITICAL and logging.CRITICAL or level == MessageLevelEnum.WARN and logging.WARNING \
-                 or level == MessageLevelEnum.ERROR and logging.ERROR or logging.INFO
+            logger_level = _LOGGER_LEVELS.get(level, logging.INFO)
             synthesis_message = SynthesisMessage(msg=message, level=level, where=where)
-        logger.log(logger_level, msg=message, extra=where and {"basin3d_where": ".".join(where)} or {})  # type: ignore
+        # Only build the log record extras if the message will actually be logged
+        if logger.isEnabledFor(logger_level):
+            # The BASIN-3D logger adds to the extra dictionary so it must not be None
+            extra = {"basin3d_where": ".".join(where)} if where else {}
+            logger.log(logger_level, msg=message, extra=extra)  # type: ignore
         return synthesis_message
 
     def info(self, message: str, where: Optional[List] = None):
@@ -89,6 +113,8 @@ class DataSourceModelIterator(MonitorMixin, Iterator):
     """
     BASIN-3D Data Source Model generator
     """
+    # An iterator is created for every list request, so skip the per-instance __dict__
+    __slots__ = ('_synthesis_response', '_model_access', '_plugins', '_where', '_model_access_iterator')
 
     @property
     def synthesis_response(self) -> SynthesisResponse:
@@ -106,85 +132,104 @@ class DataSourceModelIterator(MonitorMixin, Iterator):
         self._synthesis_response = SynthesisResponse(query=query)  # type: ignore[call-arg]
         self._model_access: 'DataSourceModelAccess' = model_access
 
-        # Filter the plugins, if specified
+        # Filter the plugins, if specified. Only the id prefixes are kept here, the plugins are not
+        # accessed until the iteration reaches them.
+        plugins = self._model_access.plugins
         if not self._synthesis_response.query.datasource:
-            self._plugins = list(self._model_access.plugins.values())
-        elif self._synthesis_response.query.datasource:
-            self._plugins = [self._model_access.plugins[d] for d in self._synthesis_response.query.datasource if
-                             d in self._model_access.plugins.keys()]
+            self._plugins = list(plugins)
+        else:
+            # a datasource specified more than once is only queried once
+            self._plugins = [d for d in dict.fromkeys(self._synthesis_response.query.datasource) if d in plugins]
 
         # Internal attributes that contain the iterator state
-        self._plugin_index = -1
-        self._model_access_iterator = None
-        self._next = None
         self._where: Optional[List] = None
-        self._where_context_token = None
+        # Skip any empty data items returned by the plugins
+        self._model_access_iterator: Iterator[Base] = filter(None, self._synthesize())
 
     def __next__(self) -> Base:
         """
         Return the next item from the iterator. If there are no further items, raise the StopIteration exception.
 
         """
+        return next(self._model_access_iterator)
 
-        while True:
-            # Is there an iterator?  Return the next data item
-            if self._model_access_iterator:
+    def _synthesize(self) -> Generator[Optional[Base], None, None]:
+        """
+        Generate the data items from each data source plugin in turn
 
-                try:
-                    self._next = next(self._model_access_iterator)
-                    if self._next:
-                        return self._next
-                except StopIteration as se:
-                    # ignore sub iterator StopIteration exception
-                    # Get any warnings that may have been generated
-                    if hasattr(se, "value") and se.value and se.value.args:
-                        if isinstance(se.value.args[0], (list, tuple, set)):
-                            for m in se.value.args[0]:
-                                self.warn(message=m)
-                        else:
-                            self.warn("Synthesis generated warnings but they are in the wrong format")
+        The plugins are iterated sequentially rather than fanned out to worker threads. The
+        metadata catalog is an in-memory SQLite database, which SQLAlchemy connects to per thread,
+        and the plugins translate their results through the catalog as they are generated.
+        """
+        model_access = self._model_access
+        model_name = model_access.synthesis_model.__name__
+        query = self._synthesis_response.query
 
+        for id_prefix in self._plugins:
+            plugin_meta = model_access.get_plugin_meta(id_prefix)
             # Setup to get the data from the next data source plugin
-            self._plugin_index += 1
-            self._model_access_iterator = None
-
-            # Are there any more plugins?
-            if self._plugin_index < len(self._plugins):
-                self._where = [self._plugins[self._plugin_index].get_datasource().id,
-                               self._model_access.synthesis_model.__name__]
-                self._where_context_token = monitor.set_ctx_basin3d_where(self._where)
-                plugin: DataSourcePluginPoint = self._plugins[self._plugin_index]
-
-                try:
-                    # Get the plugin view and determine if it has a list method
-                    plugin_views = plugin.get_plugin_access()
-                    if self._model_access.synthesis_model in plugin_views and \
-                            hasattr(plugin_views[self._model_access.synthesis_model], "list"):
-
-                        # Now translate the query object
-                        translated_query_params: QueryBase = self._model_access.synthesize_query(
-                            plugin_views[self._model_access.synthesis_model],
-                            self._synthesis_response.query)
-                        translated_query_params.datasource = [plugin.get_datasource().id]
-
-                        # Get the model access iterator if synthesized query is valid
-                        if translated_query_params.is_valid_translated_query:
-                            self._model_access_iterator = plugin_views[self._model_access.synthesis_model].list(
-                                query=translated_query_params)
-                        else:
-                            self.warn(f'Translated query for datasource {plugin.get_datasource().id} is not valid.')
-
-                    else:
-                        self.warn("Plugin view does not exist")
-
-                except Exception as e:
-                    self.error(f"Unexpected Error({e.__class__.__name__}): {str(e)}")
+            self._where = [plugin_meta.datasource.id, model_name]
+            where_context_token = monitor.set_ctx_basin3d_where(self._where)
+            where_context = monitor.get_ctx_basin3d_where()
+            try:
+                yield from self._synthesize_plugin(model_access, query, plugin_meta)
+            finally:
+                # Clear the context as soon as the plugin is done. An abandoned iterator is closed by garbage
+                # collection, possibly in another context or after the caller set its own where context,
+                # so only reset the where context when it is still the one set for this plugin.
+                if monitor.get_ctx_basin3d_where() is where_context:
+                    try:
+                        monitor.basin3d_where.reset(where_context_token)  # type: ignore[arg-type]
+                    except ValueError:
+                        # the token was created in a different context
+                        pass
+
+    def _synthesize_plugin(self, model_access: 'DataSourceModelAccess', query: QueryBase,
+                           plugin_meta: PluginMeta) -> Generator[Optional[Base], None, None]:
+        """
+        Generate the data items from a single data source plugin
+
+        :param model_access: Model access
+        :param query: the unsynthesized query
+        :param plugin_meta: the metadata of the plugin to generate the data items from
+        """
+        datasource = plugin_meta.datasource
+        model_access_iterator = None
+
+        try:
+            # Determine if the plugin view has a list method
+            plugin_view = plugin_meta.plugin_view
+            if plugin_view and plugin_meta.supports_list:
+
+                # Now translate the query object
+                translated_query_params: QueryBase = model_access.synthesize_query(plugin_view, query)
+                translated_query_params.datasource = [datasource.id]
+
+                # Skip the plugin if none of the specified identifiers are for this datasource,
+                # otherwise get the model access iterator if synthesized query is valid
+                if not has_datasource_values(query, translated_query_params):
+                    logger.debug(f'Translated query for datasource {datasource.id} has no values for the datasource.')
+                elif translated_query_params.is_valid_translated_query:
+                    model_access_iterator = plugin_view.list(query=translated_query_params)  # type: ignore[attr-defined]
+                else:
+                    self.warn(f'Translated query for datasource {datasource.id} is not valid.')
 
             else:
-                # Clear all context
-                if self._where_context_token:
-                    monitor.basin3d_where.reset(self._where_context_token)
-                raise StopIteration
+                self.warn("Plugin view does not exist")
+
+        except Exception as e:
+            self.error(f"Unexpected Error({e.__class__.__name__}): {str(e)}")
+
+        if model_access_iterator:
+            # Stream the data items straight from the plugin iterator.
+            # Its return value holds any warnings that may have been generated
+            stop_iteration = yield from model_access_iterator
+            if stop_iteration and stop_iteration.args:
+                if isinstance(stop_iteration.args[0], (list, tuple, set)):
+                    for m in stop_iteration.args[0]:
+                        self.warn(message=m)
+                else:
+                    self.warn("Synthesis generated warnings but they are in the wrong format")
 
     def log(self, message: str, level: Optional[MessageLevelEnum] = None, where: Optional[List] = None):  # type: ignore[override]
         """
@@ -206,11 +251,32 @@ class DataSourceModelAccess(MonitorMixin):
     def __init__(self, plugins, catalog):
         self._plugins = plugins
         self._catalog = catalog
+        self._plugin_meta: Dict[str, PluginMeta] = {}
 
     @property
     def plugins(self):
         return self._plugins
 
+    def get_plugin_meta(self, id_prefix: str) -> PluginMeta:
+        """
+        Get the plugin, its datasource and its plugin view for the synthesis model for the specified
+        datasource id prefix. The plugin metadata do not change once the plugins are loaded, so they
+        are resolved once and cached for subsequent requests.
+
+        :param id_prefix: The datasource id prefix of the plugin
+        :return: The plugin metadata
+        :raises KeyError: if there is no plugin for the id prefix
+        """
+        if id_prefix not in self._plugin_meta:
+            plugin = self._plugins[id_prefix]
+            plugin_view = plugin.get_plugin_access().get(self.synthesis_model)
+            self._plugin_meta[id_prefix] = PluginMeta(plugin=plugin,
+                                                      datasource=plugin.get_datasource(),
+                                                      plugin_view=plugin_view,
+                                                      supports_list=callable(getattr(plugin_view, "list", None)),
+                                                      supports_get=callable(getattr(plugin_view, "get", None)))
+        return self._plugin_meta[id_prefix]
+
     @property
     def synthesis_model(self):
         raise NotImplementedError
@@ -218,20 +284,23 @@ class DataSourceModelAccess(MonitorMixin):
     def synthesize_query(self, plugin_access: DataSourcePluginAccess,
                          query: QueryBase) -> QueryBase:
         """
-        Synthesizes query parameters, if necessary
+        Synthesizes query parameters, if necessary. By default, the BASIN-3D vocabularies in
+        the query are translated to the datasource vocabularies. Subclasses that have additional
+        synthesis rules should override this and call it once their rules are applied.
 
         :param query: The query information to be synthesized
         :param plugin_access: The plugin view to synthesize query params for
         :return: The synthesized query information
         """
-        # do nothing, subclasses may override this
-        raise NotImplementedError
+        return translate_query(plugin_access, query)  # type: ignore[arg-type]
 
-    @monitor.ctx_synthesis
     def list(self, query: QueryBase) -> DataSourceModelIterator:
         """
         Return the synthesized plugin results
 
+        The synthesis context is not set here. The iterator is returned before any plugin is queried and
+        it sets the basin3d_where context itself for each plugin as it is iterated.
+
         :param query: The query for this function
         """
         return DataSourceModelIterator(query, self)
@@ -246,6 +315,7 @@ class DataSourceModelAccess(MonitorMixin):
         """
         datasource_id: Optional[str] = None
         datasource = None
+        item: Optional[Base] = None
         messages: List[Optional[SynthesisMessage]] = []
 
         if 'messages' in kwargs and kwargs.get('messages'):
@@ -273,35 +343,34 @@ class DataSourceModelAccess(MonitorMixin):
                     break
 
             if value and isinstance(value, str):
-                datasource_id = value.split("-")[0]
+                # the datasource id prefix is everything before the first dash
+                datasource_id = value.partition("-")[0]
 
-        try:
-            plugin = self.plugins[datasource_id]
-            datasource = plugin.get_datasource()
-        except KeyError:
-            pass
+        if datasource_id in self.plugins:
+            plugin_meta = self.get_plugin_meta(datasource_id)  # type: ignore[arg-type]
+            datasource = plugin_meta.datasource
 
         if datasource:
 
-            plugin_views = plugin.get_plugin_access()
-            monitor.set_ctx_basin3d_where([plugin.get_datasource().id, self.synthesis_model.__name__])
-            if self.synthesis_model in plugin_views and hasattr(plugin_views[self.synthesis_model], 'get'):
+            where = [datasource.id, self.synthesis_model.__name__]
+            monitor.set_ctx_basin3d_where(where)
+            plugin_view = plugin_meta.plugin_view
+            if plugin_view and plugin_meta.supports_get:
 
                 # Now translate the query object
-                translated_query_params: QueryBase = self.synthesize_query(plugin_views[self.synthesis_model], query)
-                translated_query_params.datasource = [plugin.get_datasource().id]
+                translated_query_params: QueryBase = self.synthesize_query(plugin_view, query)
+                translated_query_params.datasource = [datasource.id]
 
                 # Get the model access iterator if synthesized query is valid
                 if translated_query_params.is_valid_translated_query:
-                    item: Optional[Base] = plugin_views[self.synthesis_model].get(query=translated_query_params)
+                    item = plugin_view.get(query=translated_query_params)  # type: ignore[attr-defined]
                 else:
-                    logger.warning(f'Translated query for datasource {plugin.get_datasource().id} is not valid.')
+                    logger.warning(f'Translated query for datasource {datasource.id} is not valid.')
 
                 if item:
                     return SynthesisResponse(query=query, data=item, messages=messages)  # type: ignore[call-arg]
             else:
-                messages.append(self.log("Plugin view does not exist", MessageLevelEnum.WARN,
-                                         [plugin.get_datasource().id, self.synthesis_model.__name__],))
+                messages.append(self.log("Plugin view does not exist", MessageLevelEnum.WARN, where))
 
         else:
             messages.append(self.log("DataSource not found for retrieve request", MessageLevelEnum.ERROR))
@@ -338,18 +407,6 @@ class MonitoringFeatureAccess(DataSourceModelAccess):
     """
     synthesis_model = MonitoringFeature
 
-    def synthesize_query(self, plugin_access: DataSourcePluginAccess, query: QueryMonitoringFeature) -> QueryBase:  # type: ignore[override]
-        """
-        Synthesizes query parameters, if necessary
-
-        Parameters Synthesized:
-
-        :param query: The query information to be synthesized
-        :param plugin_access: The plugin view to synthesize query params for
-        :return: The synthesized query information
-        """
-        return translate_query(plugin_access, query)
-
     def retrieve(self, query: QueryMonitoringFeature) -> SynthesisResponse:
         """
         Retrieve the specified Monitoring Feature
@@ -433,7 +490,8 @@ class MeasurementTimeseriesTVPObservationAccess(DataSourceModelAccess):
 
         # only allow instantaneous data (NONE) or daily data (DAY) data
         # NOTE: query at this point is still in BASIN-3D vocab
-        if query.aggregation_duration != AggregationDurationEnum.NONE:
+        # The query is synthesized for each plugin, only overwrite the value when it changes
+        if query.aggregation_duration not in (AggregationDurationEnum.NONE, AggregationDurationEnum.DAY):
             query.aggregation_duration = AggregationDurationEnum.DAY
 
-        return translate_query(plugin_access, query)
+        return super().synthesize_query(plugin_access, query)
@@ -11,7 +11,7 @@
 
 """
 
-from itertools import product, repeat
+from itertools import product
 from typing import List, Optional, Union
 
 from basin3d.core import monitor
@@ -22,40 +22,20 @@ from basin3d.core.schema.query import QueryBase, QueryMeasurementTimeseriesTVP,
 logger = monitor.get_logger(__name__)
 
 
-def _clean_query(translated_query: QueryBase) -> QueryBase:
+def _clean_query_attr(translated_query: QueryBase, attr: str):
     """
-    Remove any NOT_SUPPORTED translations
+    Remove any NOT_SUPPORTED translations from a single query attribute
 
     :param translated_query: the translated query that may have NOT_SUPPORTED translation results
-    :return: cleaned query that has all NOT_SUPPORTED translations removed
+    :param attr: the mapped query attribute to clean
     """
-    for attr in translated_query.mapped_fields:
-        attr_value = getattr(translated_query, attr)
-        if attr_value and isinstance(attr_value, list):
-            clean_list = [val for val in attr_value if val != NO_MAPPING_TEXT]
-            unique_list = list(set(clean_list))
-            setattr(translated_query, attr, unique_list)
-        elif attr_value and attr_value == NO_MAPPING_TEXT:
-            setattr(translated_query, attr, None)
-    return translated_query
-
-
-def _get_attr_types_in_compound_mappings(plugin_access) -> list:
-    """
-    Get all the compound mappings for a datasource if any exist
-
-    :param plugin_access: plugin access
-    :return: list of attribute types that are part of a compound mapping.
-    """
-    compound_mapping_attrs = set()
-
-    attr_mapping_iterator = plugin_access.get_attribute_mappings()
-
-    for attr_mapping in attr_mapping_iterator:
-        if MAPPING_DELIMITER in attr_mapping.attr_type:
-            compound_mapping_attrs.add(attr_mapping.attr_type)
-
-    return list(compound_mapping_attrs)
+    attr_value = getattr(translated_query, attr)
+    if attr_value and isinstance(attr_value, list):
+        # remove the NOT_SUPPORTED translations and any duplicates in a single pass, preserving the order
+        unique_list = list(dict.fromkeys(val for val in attr_value if val != NO_MAPPING_TEXT))
+        setattr(translated_query, attr, unique_list)
+    elif attr_value and attr_value == NO_MAPPING_TEXT:
+        setattr(translated_query, attr, None)
 
 
 def _get_attr_type_if_compound_mapping(plugin_access, attr_type: str) -> Optional[str]:
@@ -66,16 +46,12 @@ def _get_attr_type_if_compound_mapping(plugin_access, attr_type: str) -> Optiona
     :param attr_type:
     :return: str if attr mapping is part of compound mapping
     """
-    compound_mapping_str = None
-    attr_type = attr_type.upper()
-    attr_mapping_iterator = plugin_access.get_attribute_mappings(attr_type=attr_type)
+    compound_mapping_str: Optional[str] = None
 
-    # look at the first element returned if there is one
-    for attr_mapping in attr_mapping_iterator:
-        if MAPPING_DELIMITER in attr_mapping.attr_type:
-            compound_mapping_str = attr_mapping.attr_type
-        # only need to look at the first attribute mapping returned
-        break
+    # only need to look at the first attribute mapping returned, if there is one
+    attr_mapping = next(plugin_access.get_attribute_mappings(attr_type=attr_type.upper()), None)
+    if attr_mapping is not None and MAPPING_DELIMITER in attr_mapping.attr_type:
+        compound_mapping_str = attr_mapping.attr_type
 
     return compound_mapping_str
 
@@ -88,56 +64,76 @@ def _get_single_attr_types_in_compound_mappings(plugin_access, attr_type: str, i
     :param include_specified_type: bool, True = include in the return the specified attr_type. False: return the other attribute types that are part of the compound mapping.
     :return: list of attributes in the compound mapping
     """
-
-    compound_mapping_attrs: List[str] = []
-
     compound_mapping_str = _get_attr_type_if_compound_mapping(plugin_access, attr_type)
 
     if not compound_mapping_str:
-        return compound_mapping_attrs
+        return []
 
-    for attr in compound_mapping_str.split(MAPPING_DELIMITER):
-        if attr == attr_type.upper() and not include_specified_type:
-            continue
-        compound_mapping_attrs.append(attr)
+    # use the compound mapping attributes already split by the plugin access
+    cm_attrs = plugin_access.get_compound_mappings().get(compound_mapping_str) or compound_mapping_str.split(MAPPING_DELIMITER)
 
-    return compound_mapping_attrs
+    if include_specified_type:
+        return list(cm_attrs)
 
+    attr_type = attr_type.upper()
+    return [attr for attr in cm_attrs if attr != attr_type]
 
-def _is_translated_query_valid(datasource_id, query, translated_query) -> Optional[bool]:
+
+def _is_translated_attr_valid(datasource_id, attr, field_type, b3d_attr_value, translated_attr_value) -> Optional[bool]:
+    """
+    Determine if a single translated query attribute is valid.
+
+    :param datasource_id: the datasource id
+    :param attr: the query attribute
+    :param field_type: the type of query field, 'mapped' or 'prefixed'
+    :param b3d_attr_value: the attribute value in the original query
+    :param translated_attr_value: the attribute value in the translated query
+    :return: boolean (True = valid, False = invalid) or None (translated attribute could not be assessed)
+    """
+    # most query fields are not specified, so check for an empty value first.
+    # An empty list means none of the specified values are for this datasource, see :func:`has_datasource_values`
+    if not translated_attr_value:
+        return True
+
+    if isinstance(translated_attr_value, list):
+        # if list and all of list == NOT_SUPPORTED, False
+        is_valid = any(x != NO_MAPPING_TEXT for x in translated_attr_value)
+    elif isinstance(translated_attr_value, str):
+        # if single NOT_SUPPORTED, False
+        is_valid = translated_attr_value != NO_MAPPING_TEXT
+    else:
+        logger.warning(
+            f'Translated query for datasource {datasource_id} cannot be assessed. Translated value for {attr} is not expected type.')
+        return None
+
+    if not is_valid:
+        msg_prefix = ''
+        if field_type == 'mapped':
+            if isinstance(b3d_attr_value, list):
+                b3d_attr_value = ', '.join(b3d_attr_value)
+            msg_prefix = f' No vocabulary found for attribute {attr} with values: {b3d_attr_value}.'
+        logger.warning(f'Translated query for datasource {datasource_id} is invalid.{msg_prefix}')
+    return is_valid
+
+
+def _validate_and_clean_query(datasource_id, query, translated_query) -> Optional[bool]:
     """
-    Determine if the translated query is valid. A valid translated query has at least one datasoure vocabulary
-    for any query field that was supecified (i.e., with a BASIN-3D vocab)
+    Determine if the translated query is valid and remove any NOT_SUPPORTED translations in a single pass over the query fields.
+    A valid translated query has at least one datasource vocabulary for any query field that was specified (i.e., with a BASIN-3D vocab).
+    The mapped attributes are cleaned as they are validated, so an invalid translated query may be partially cleaned.
 
     :param datasource_id: the datasource id
     :param query: the original query
-    :param translated_query: the translated query
+    :param translated_query: the translated query, cleaned in place
     :return: boolean (True = valid translated query, False = invalid translated query) or None (translated query could not be assessed)
     """
-    for field_type, field_list in zip(['mapped', 'prefixed'], [query.mapped_fields, query.prefixed_fields]):
-        # loop thru kwargs
+    for field_type, field_list in (('mapped', query.mapped_fields), ('prefixed', query.prefixed_fields)):
         for attr in field_list:
-            translated_attr_value = getattr(translated_query, attr)
-            b3d_attr_value = getattr(query, attr)
-            msg_prefix = ''
+            is_valid = _is_translated_attr_valid(datasource_id, attr, field_type, getattr(query, attr), getattr(translated_query, attr))
+            if not is_valid:
+                return is_valid
             if field_type == 'mapped':
-                msg_prefix = 'No vocabulary found for attribute {attr} with values: {b3d_attr_value}.'
-            if isinstance(b3d_attr_value, list):
-                b3d_attr_value = ', '.join(b3d_attr_value)
-            if translated_attr_value and isinstance(translated_attr_value, list):
-                # if list and all of list == NOT_SUPPORTED, False
-                if all([x == NO_MAPPING_TEXT for x in translated_attr_value]):
-                    logger.warning(f'Translated query for datasource {datasource_id} is invalid.{msg_prefix}')
-                    return False
-            elif translated_attr_value and isinstance(translated_attr_value, str):
-                # if single NOT_SUPPORTED, False
-                if translated_attr_value == NO_MAPPING_TEXT:
-                    logger.warning(f'Translated query for datasource {datasource_id} is invalid.{msg_prefix}')
-                    return False
-            elif translated_attr_value:
-                logger.warning(
-                    f'Translated query for datasource {datasource_id} cannot be assessed. Translated value for {attr} is not expected type.')
-                return None
+                _clean_query_attr(translated_query, attr)
     return True
 
 
@@ -149,29 +145,22 @@ def _order_mapped_fields(plugin_access, query_mapped_fields):
     :param query_mapped_fields:
     :return:
     """
-    query_mapped_fields_ordered = []
-
-    # get list of compound mappings if any
-    compound_mappings = _get_attr_types_in_compound_mappings(plugin_access)
+    # get the attributes of the compound mappings if any. These are split once per plugin access and then reused.
+    cm_fields = plugin_access.get_compound_mapping_fields()
 
     # If there are compound mappings...
-    if compound_mappings:
-        cm_fields = []
-        # Split up the compound mappings, preserving the order of the attributes as specified in the plugin mapping file.
-        # The order only matters relative to the individual compound mapping.
-        for cm in compound_mappings:
-            cm_attrs = cm.split(MAPPING_DELIMITER)
-            cm_fields.extend([cm_attr.lower() for cm_attr in cm_attrs])
+    if cm_fields:
+        query_mapped_fields_ordered = []
+        remaining_fields = set(query_mapped_fields)
         # first loop thru the compound mapping fields
         for cm in cm_fields:
             # if the attribute is one of the mapped fields in this particular query
-            if cm in query_mapped_fields:
-                # add it to the ordered list
+            if cm in remaining_fields:
+                # add it to the ordered list and then remove it from the remaining fields
                 query_mapped_fields_ordered.append(cm)
-                # then remove it from the mapped field list
-                query_mapped_fields.pop(query_mapped_fields.index(cm))
-        # then, add any remaining non-compound fields
-        query_mapped_fields_ordered.extend(query_mapped_fields)
+                remaining_fields.discard(cm)
+        # then, add any remaining non-compound fields in their original order
+        query_mapped_fields_ordered.extend(field for field in query_mapped_fields if field in remaining_fields)
     else:
         # if there are no compound mappings, then the order doesn't matter, just copy the mapped field list.
         query_mapped_fields_ordered = query_mapped_fields
@@ -183,10 +172,11 @@ def _translate_mapped_query_attrs(plugin_access, query: Union[QueryMeasurementTi
     """
     Translation functionality
     """
-    query_mapped_fields = query.mapped_fields.copy()
+    # the mapped fields are an immutable tuple defined once on the query class, so they do not need to be copied
+    query_mapped_fields = query.mapped_fields
 
-    # if there are no mapped fields, return the query as is.
-    if not query_mapped_fields:
+    # if there are no mapped fields, or none of them are specified, return the query as is.
+    if not any(getattr(query, attr) for attr in query_mapped_fields):
         return query
 
     # order the query fields by any compound attributes
@@ -196,28 +186,41 @@ def _translate_mapped_query_attrs(plugin_access, query: Union[QueryMeasurementTi
         # if the attribute is specified, proceed to translate it
         # NOTE: looking in the translated_query which is mutable. As the translation occurs, translated query fields may change
         #       and the if statement may have different values for a given field during the loop.
-        if getattr(query, attr):
-            b3d_vocab = getattr(query, attr)
+        b3d_vocab = getattr(query, attr)
+        if b3d_vocab:
+            attr_type = attr.upper()
+
+            # look up whether the attr is part of a compound mapping, once for both the translation and the clean up below
+            compound_mapping_attrs = _get_single_attr_types_in_compound_mappings(plugin_access, attr_type, include_specified_type=True)
 
             if isinstance(b3d_vocab, str):
-                ds_vocab = _translate_to_datasource_vocab(plugin_access, attr.upper(), b3d_vocab, query)
+                ds_vocab = _translate_to_datasource_vocab(plugin_access, attr_type, b3d_vocab, query, compound_mapping_attrs)
             else:
-                ds_vocab = []
-                for b3d_value in b3d_vocab:
-                    # handle multiple values returned
-                    ds_vocab.extend(_translate_to_datasource_vocab(plugin_access, attr.upper(), b3d_value, query))
+                ds_vocab = _translate_to_datasource_vocabs(plugin_access, attr_type, b3d_vocab, query, compound_mapping_attrs)
             setattr(query, attr, ds_vocab)
 
-            # look up whether the attr is part of a compound mapping
-            compound_attrs = _get_single_attr_types_in_compound_mappings(plugin_access, attr)
-            # if so: for any compound attrs, clear out the values in the synthesized query b/c search needs to be done on the coupled datasource_vocab
-            for compound_attr in compound_attrs:
-                setattr(query, compound_attr.lower(), None)
+            # for any other compound attrs, clear out the values in the synthesized query b/c search needs to be done on the coupled datasource_vocab
+            for compound_attr in compound_mapping_attrs:
+                if compound_attr != attr_type:
+                    setattr(query, compound_attr.lower(), None)
 
     # NOTE: always returns list for each mapped attr b/c multiple datasource vocab can be mapped to a single BASIN-3D vocab.
     return query
 
 
+def _strip_datasource_id_prefix(identifier: str, id_prefix: str) -> Optional[str]:
+    """
+    Extract the datasource identifier from the BASIN-3D identifier
+
+    :param identifier: the BASIN-3D identifier
+    :param id_prefix: the datasource id prefix, including the delimiter
+    :return: the datasource identifier, None if the identifier is not for the datasource
+    """
+    if identifier.startswith(id_prefix):
+        return identifier[len(id_prefix):]
+    return None
+
+
 def _translate_prefixed_query_attrs(plugin_access, query: Union[QueryMeasurementTimeseriesTVP, QueryMonitoringFeature]) -> QueryBase:
     """
 
@@ -225,39 +228,58 @@ def _translate_prefixed_query_attrs(plugin_access, query: Union[QueryMeasurement
     :param query:
     :return:
     """
-    def extract_id(identifer):
-        """
-        Extract the datasource identifier from the broker identifier
-        :param identifer:
-        :return:
-        """
-        if identifer:
-            site_list = identifer.split("-")
-            identifer = identifer.replace("{}-".format(site_list[0]), "", 1)  # The datasource id prefix needs to be removed
-        return identifer
-
-    id_prefix = plugin_access.datasource.id_prefix
+    # the datasource id prefix, including the delimiter, is the same for all prefixed fields
+    id_prefix = f"{plugin_access.datasource.id_prefix}-"
+    id_prefix_len = len(id_prefix)
 
     for attr in query.prefixed_fields:
         attr_value = getattr(query, attr)
         if attr_value:
+            translated_value: Union[str, List[str]]
 
             # if the value is a string
             if isinstance(attr_value, str):
-                translated_value = extract_id(attr_value)
-                if translated_value == attr_value:
-                    translated_value = NO_MAPPING_TEXT
+                translated_value = _strip_datasource_id_prefix(attr_value, id_prefix) or NO_MAPPING_TEXT
 
             # otherwise assume it is a list
             else:
-                translated_value = [extract_id(x) for x in attr_value if x.startswith("{}-".format(id_prefix))]
+                translated_value = [x[id_prefix_len:] for x in attr_value if x.startswith(id_prefix)]
 
             setattr(query, attr, translated_value)
 
     return query
 
 
-def _translate_to_datasource_vocab(plugin_access, attr_type: str, basin3d_vocab: str, b3d_query) -> list:
+def _translate_to_datasource_vocabs(plugin_access, attr_type: str, basin3d_vocabs: List[str], b3d_query,
+                                    compound_mapping_attrs: Optional[List[str]] = None) -> list:
+    """
+    Find the datasource vocabularies for a list of BASIN-3D vocabularies of the same attribute type.
+    The compound mapping attributes for the attribute type are only looked up once for all of the vocabularies.
+
+    :param plugin_access: plugin access
+    :param attr_type: the attribute type
+    :param basin3d_vocabs: list of the BASIN-3D vocabularies
+    :param b3d_query: either a QueryBase class or subclass object, or a dictionary
+    :param compound_mapping_attrs: the attributes of the compound mapping the attr_type is part of, if already known
+    :return: list of the datasource vocabularies
+    """
+    attr_type = attr_type.upper()
+    if compound_mapping_attrs is None:
+        compound_mapping_attrs = _get_single_attr_types_in_compound_mappings(plugin_access, attr_type, include_specified_type=True)
+
+    # a single vocabulary is the common case, so skip building the combined list
+    if len(basin3d_vocabs) == 1:
+        return _translate_to_datasource_vocab(plugin_access, attr_type, basin3d_vocabs[0], b3d_query, compound_mapping_attrs)
+
+    ds_vocab: List[str] = []
+    for basin3d_vocab in basin3d_vocabs:
+        # handle multiple values returned
+        ds_vocab.extend(_translate_to_datasource_vocab(plugin_access, attr_type, basin3d_vocab, b3d_query, compound_mapping_attrs))
+    return ds_vocab
+
+
+def _translate_to_datasource_vocab(plugin_access, attr_type: str, basin3d_vocab: str, b3d_query,
+                                   compound_mapping_attrs: Optional[List[str]] = None) -> list:
     """
     Find the datasource vocabulary(ies) for the specified datasource, attribute type, BASIN-3D vocabulary, and full query that may specify other attributes.
     Because multiple datasource vocabularies can be mapped to the same BASIN-3D vocabulary, the return is a list of the datasource vocabs.
@@ -266,23 +288,28 @@ def _translate_to_datasource_vocab(plugin_access, attr_type: str, basin3d_vocab:
     :param attr_type: the attribute type
     :param basin3d_vocab: the BASIN-3D vocabulary
     :param b3d_query: either a QueryBase class or subclass object, or a dictionary
+    :param compound_mapping_attrs: the attributes of the compound mapping the attr_type is part of, if already known
     :return: list of the datasource vocabularies
     """
     # convert attr_type to uppercase
     attr_type = attr_type.upper()
 
     # is the attr_type part of a compound mapping?
-    compound_mapping_attrs = _get_single_attr_types_in_compound_mappings(plugin_access, attr_type, include_specified_type=True)
+    if compound_mapping_attrs is None:
+        compound_mapping_attrs = _get_single_attr_types_in_compound_mappings(plugin_access, attr_type, include_specified_type=True)
 
     b3d_vocab_combo_str = [basin3d_vocab]
 
     # if compound_mapping, find all the relevant value combos given the query
     if compound_mapping_attrs:
         b3d_vocab_filter_lists = []  # list to hold lists of specified filters, one for each attr
+        b3d_is_query = isinstance(b3d_query, QueryBase)
+        b3d_is_dict = isinstance(b3d_query, dict)
 
         # loop thru each of the compound mapping attributes, build a list of lists of query combos
         for attr in compound_mapping_attrs:
             attr_value = None
+            attr_l = attr.lower()
 
             # by default: match any number of characters excepting a new line for the attribute
             # replace this value below if a value for the attribute is specified in the query
@@ -290,10 +317,10 @@ def _translate_to_datasource_vocab(plugin_access, attr_type: str, basin3d_vocab:
             # if the attr is the attr_type, set the filter to the specified vocab
             if attr == attr_type:
                 filter_values = [basin3d_vocab]
-            elif issubclass(b3d_query.__class__, QueryBase) and hasattr(b3d_query, attr.lower()):
-                attr_value = getattr(b3d_query, attr.lower())
-            elif isinstance(b3d_query, dict) and attr.lower() in b3d_query.keys():
-                attr_value = b3d_query.get(attr.lower())
+            elif b3d_is_query:
+                attr_value = getattr(b3d_query, attr_l, None)
+            elif b3d_is_dict:
+                attr_value = b3d_query.get(attr_l)
 
             # if there is a value, replace the default value
             if attr_value:
@@ -305,11 +332,8 @@ def _translate_to_datasource_vocab(plugin_access, attr_type: str, basin3d_vocab:
             # append the filter list to the main list
             b3d_vocab_filter_lists.append(filter_values)
 
-        # create a list of sets contain the combinations of filter options for each attr
-        b3d_vocab_combo_sets = list(product(*b3d_vocab_filter_lists))
-
-        # change each set into a str for search
-        b3d_vocab_combo_str = [MAPPING_DELIMITER.join(v) for v in b3d_vocab_combo_sets]
+        # create the combinations of filter options for each attr and change each into a str for search
+        b3d_vocab_combo_str = [MAPPING_DELIMITER.join(v) for v in product(*b3d_vocab_filter_lists)]
 
     ds_vocab: List[str] = []
     no_match_list: List[str] = []
@@ -318,12 +342,10 @@ def _translate_to_datasource_vocab(plugin_access, attr_type: str, basin3d_vocab:
     for basin3d_vocab_str in b3d_vocab_combo_str:
         results_iterator = plugin_access.get_attribute_mappings(attr_type=attr_type,
                                                                 attr_vocab=basin3d_vocab_str, from_basin3d=True)
-        query_results = []
 
         # there may be more than one datasource variable mapped to the specified BASIN-3D vocab
-        # Loop thru the results and collect all of them.
-        for qr in results_iterator:
-            query_results.append(qr.datasource_vocab)
+        # collect all of them.
+        query_results = [qr.datasource_vocab for qr in results_iterator]
 
         # If there were indeed mappings, add them to the main ds_vocab list and move on
         if query_results:
@@ -359,7 +381,8 @@ def get_datasource_mapped_attribute(plugin_access, attr_type, datasource_vocab):
         return plugin_access.get_datasource_attribute_mapping(attr_type, datasource_vocab)
 
     elif isinstance(datasource_vocab, list):
-        return list(map(plugin_access.get_datasource_attribute_mapping, repeat(attr_type), datasource_vocab))
+        get_attribute_mapping = plugin_access.get_datasource_attribute_mapping
+        return [get_attribute_mapping(attr_type, vocab) for vocab in datasource_vocab]
 
 
 def translate_attributes(plugin_access, mapped_attrs, **kwargs):
@@ -375,24 +398,40 @@ def translate_attributes(plugin_access, mapped_attrs, **kwargs):
     :return: kwargs: the model's attributes, including the translated attributes
     """
 
-    # copy the kwargs be able to loop thru the original while modifying the actual for compound mappings
-    kwargs_orig = kwargs.copy()
+    # select the mapped attrs specified before the loop, the compound mappings below may add
+    # other mapped attrs to the kwargs that are already translated.
+    specified_attrs = [attr for attr in mapped_attrs if attr in kwargs]
+
+    for attr in specified_attrs:
+        datasource_vocab = kwargs[attr]
+        attr_type = attr.upper()
+        attr_mapping = get_datasource_mapped_attribute(plugin_access, attr_type=attr_type, datasource_vocab=datasource_vocab)
+        kwargs[attr] = attr_mapping
+
+        # If the attr is part of a compound mapping and the compound attr is not part of the kwargs, set it.
+        # The compound mapping attribute types are already upper case.
+        cm_attrs = _get_single_attr_types_in_compound_mappings(plugin_access, attr_type)
+        for cm_attr in cm_attrs:
+            cm_attr_name = cm_attr.lower()
+            if cm_attr_name not in kwargs:
+                cm_attr_mapping = get_datasource_mapped_attribute(plugin_access, attr_type=cm_attr, datasource_vocab=datasource_vocab)
+                kwargs[cm_attr_name] = cm_attr_mapping
 
-    for attr in mapped_attrs:
-        if attr in kwargs_orig:
-            datasource_vocab = kwargs[attr]
-            attr_mapping = get_datasource_mapped_attribute(plugin_access, attr_type=attr.upper(), datasource_vocab=datasource_vocab)
-            kwargs[attr] = attr_mapping
+    return kwargs
 
-            # If the attr is part of a compound mapping and the compound attr is not part of the kwargs, set it.
-            cm_attrs = _get_single_attr_types_in_compound_mappings(plugin_access, attr)
-            if cm_attrs:
-                for cm_attr in cm_attrs:
-                    if cm_attr.lower() not in kwargs:
-                        cm_attr_mapping = get_datasource_mapped_attribute(plugin_access, attr_type=cm_attr.upper(), datasource_vocab=datasource_vocab)
-                        kwargs[cm_attr.lower()] = cm_attr_mapping
 
-    return kwargs
+def has_datasource_values(query: QueryBase, translated_query: QueryBase) -> bool:
+    """
+    Determine if the translated query has values for the datasource. When none of the values specified for a
+    prefixed field (e.g., monitoring_feature) have the datasource id prefix, the translated value is an empty list
+    and there is nothing to query in the datasource. A field that was specified as an empty list in the original
+    query is left as is by the translation, so it does not count as having no values for the datasource.
+
+    :param query: the original query
+    :param translated_query: the translated query
+    :return: boolean (True = there are values to query, False = none of the specified values are for the datasource)
+    """
+    return not any(getattr(query, attr) and getattr(translated_query, attr) == [] for attr in query.prefixed_fields)
 
 
 def translate_query(plugin_access, query: Union[QueryMeasurementTimeseriesTVP, QueryMonitoringFeature]) -> QueryBase:
@@ -403,13 +442,13 @@ def translate_query(plugin_access, query: Union[QueryMeasurementTimeseriesTVP, Q
     :param query: query to be translated
     :return: translated query as a :class:`basin3d.core.schema.query.QueryBase` object
     """
+    # A shallow copy is enough: the translation replaces attribute values with setattr, it never mutates them in place
     translated_query = query.copy()
     _translate_mapped_query_attrs(plugin_access, translated_query)
     _translate_prefixed_query_attrs(plugin_access, translated_query)
-    is_valid_translated_query = _is_translated_query_valid(plugin_access.datasource.id, query, translated_query)
+    is_valid_translated_query = _validate_and_clean_query(plugin_access.datasource.id, query, translated_query)
 
     if is_valid_translated_query:
         translated_query.is_valid_translated_query = is_valid_translated_query
-        _clean_query(translated_query)
 
     return translated_query
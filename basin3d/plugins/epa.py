@@ -17,6 +17,7 @@ import requests
 import urllib.parse
 
 from copy import deepcopy
+from functools import lru_cache
 from typing import Iterator, List, Optional, Union
 from datetime import datetime as dt, date
 
@@ -466,6 +467,39 @@ def _convert_distance_unit_to_meters(unit: str) -> Optional[float]:
     return multiplier
 
 
+@lru_cache(maxsize=4096)
+def _parse_epa_timestamp(start_date: str, start_time: Optional[str], start_time_zone: Optional[str]) -> str:
+    """
+    Parse the EPA start date, time and time zone into an ISO timestamp. The same few timestamps
+    and time zones repeat across the rows of a result set, so the parsed timestamps are cached.
+
+    :param start_date: the start date, YYYY-MM-DD
+    :param start_time: the start time, HH:MM:SS
+    :param start_time_zone: the EPA time zone code, see TIMEZONE_MAP
+    :return: the ISO timestamp
+    :raises ValueError: if the timestamp cannot be parsed
+    """
+    start_timestamp_str = f'{start_date}'
+    timestamp_str_format = '%Y-%m-%d'
+
+    if start_time:
+        timestamp_str_format += ' %H:%M:%S'
+        start_timestamp_str += f' {start_time}'
+
+    if start_time_zone:
+        mapped_time_zone = TIMEZONE_MAP.get(start_time_zone)
+        if mapped_time_zone:
+            start_time_zone_int = mapped_time_zone.get("utc_offset")
+            if start_time_zone_int:
+                start_timestamp_str += start_time_zone_int
+                timestamp_str_format += '%z'
+
+    try:
+        return dt.strptime(start_timestamp_str, timestamp_str_format).isoformat(sep='T')
+    except Exception as e:
+        raise ValueError(f'{start_timestamp_str}; {e}')
+
+
 def _parse_epa_results_phys_chem(wqp_response: requests.Response, query: QueryMeasurementTimeseriesTVP, op_map: dict,
                                  results: dict, synthesis_messages: list, api_version: str = EPA_WQP_API_VERSION) -> set:
     """
@@ -525,33 +559,21 @@ def _parse_epa_results_phys_chem(wqp_response: requests.Response, query: QueryMe
             return None
         return value
 
+    # the timestamp field names only depend on the api version
+    start_date_field = FIELD_NAMES['start_date'][api_version]
+    start_time_field = FIELD_NAMES['start_time'][api_version]
+    start_time_zone_field = FIELD_NAMES['start_time_zone'][api_version]
+
     def make_timestamp(row_dict: dict) -> Optional[str]:
-        start_date = row_dict.get(FIELD_NAMES['start_date'][api_version])
+        start_date = row_dict.get(start_date_field)
         if not start_date:
             return None
 
-        start_timestamp_str = f'{start_date}'
-        timestamp_str_format = '%Y-%m-%d'
-
-        start_time = row_dict.get(FIELD_NAMES['start_time'][api_version])
-        if start_time:
-            timestamp_str_format += ' %H:%M:%S'
-            start_timestamp_str += f' {start_time}'
-
-        start_time_zone = row_dict.get(FIELD_NAMES['start_time_zone'][api_version])
-        if start_time_zone:
-            mapped_time_zone = TIMEZONE_MAP.get(start_time_zone)
-            if mapped_time_zone:
-                start_time_zone_int = mapped_time_zone.get("utc_offset")
-                if start_time_zone_int:
-                    start_timestamp_str += start_time_zone_int
-                    timestamp_str_format += '%z'
-
         try:
-            return dt.strptime(start_timestamp_str, timestamp_str_format).isoformat(sep='T')
-        except Exception as e:
+            return _parse_epa_timestamp(start_date, row_dict.get(start_time_field), row_dict.get(start_time_zone_field))
+        except ValueError as e:
             # ToDo: enhancement, include more info in the msg
-            msg = f'Could not parse and convert start timestamp: {start_timestamp_str}; {e}'
+            msg = f'Could not parse and convert start timestamp: {e}'
             synthesis_messages.append(msg)
             logger.warning(msg)
             return None
@@ -140,3 +140,101 @@ def test_plugin_exceptions(plugin, messages, synthesis_call, synthesis_args):
 
     syn_response = synthesis_response.dict()
     assert syn_response["messages"] == messages
+
+
+def test_plugin_access_basin3d_vocab_cached():
+    """Test that attribute mapping lookups are only searched for once in the catalog"""
+    from basin3d.core.models import DataSource
+    from basin3d.core.plugin import DataSourcePluginAccess
+
+    catalog = Mock()
+    catalog.find_attribute_mappings.return_value = iter(['mapping'])
+    plugin_access = DataSourcePluginAccess(DataSource(id='Alpha', id_prefix='A'), catalog)
+
+    for _ in range(2):
+        assert list(plugin_access.get_attribute_mappings('STATISTIC', 'MEAN', from_basin3d=True)) == ['mapping']
+    catalog.find_attribute_mappings.assert_called_once_with('Alpha', 'STATISTIC', 'MEAN', True)
+
+    # attribute type only searches, e.g. for compound mappings, are cached separately
+    catalog.find_attribute_mappings.reset_mock()
+    catalog.find_attribute_mappings.return_value = iter(['compound'])
+    for _ in range(2):
+        assert list(plugin_access.get_attribute_mappings(attr_type='STATISTIC')) == ['compound']
+    catalog.find_attribute_mappings.assert_called_once_with('Alpha', 'STATISTIC', None, False)
+
+
+def test_plugin_access_basin3d_vocab_cache_bounded(monkeypatch):
+    """Test that only the most recently used attribute mapping lookups are cached"""
+    from basin3d.core.models import DataSource
+    from basin3d.core.plugin import DataSourcePluginAccess
+
+    monkeypatch.setattr(DataSourcePluginAccess, 'attribute_mapping_cache_size', 2)
+    catalog = Mock()
+    catalog.find_attribute_mappings.side_effect = lambda *args: iter([args[2]])
+    plugin_access = DataSourcePluginAccess(DataSource(id='Alpha', id_prefix='A'), catalog)
+
+    for vocab in ['MEAN', 'MIN', 'MEAN', 'MAX', 'MEAN', 'MIN']:
+        assert list(plugin_access.get_attribute_mappings('STATISTIC', vocab, from_basin3d=True)) == [vocab]
+
+    # MEAN is kept as the most recently used, MIN is searched for again after MAX is cached
+    assert [c.args[2] for c in catalog.find_attribute_mappings.call_args_list] == ['MEAN', 'MIN', 'MAX', 'MIN']
+    assert len(plugin_access._attribute_mappings) == 2
+
+    # datasource vocabulary and attribute type only searches share the same bound
+    plugin_access.get_attribute_mappings('STATISTIC', 'avg')
+    plugin_access.get_attribute_mappings('STATISTIC')
+    assert len(plugin_access._attribute_mappings) == 2
+    assert list(plugin_access._attribute_mappings) == [('STATISTIC', 'avg', False), ('STATISTIC', None, False)]
+
+
+def test_plugin_access_compound_mapping_fields():
+    """Test that the compound mapping fields are split once and cached"""
+    from basin3d.core.models import DataSource
+    from basin3d.core.plugin import DataSourcePluginAccess
+
+    catalog = Mock()
+    catalog.find_attribute_mappings.return_value = iter([Mock(attr_type='STATISTIC'),
+                                                         Mock(attr_type='OBSERVED_PROPERTY:SAMPLING_MEDIUM'),
+                                                         Mock(attr_type='OBSERVED_PROPERTY:STATISTIC')])
+    plugin_access = DataSourcePluginAccess(DataSource(id='Alpha', id_prefix='A'), catalog)
+
+    for _ in range(2):
+        assert plugin_access.get_compound_mapping_fields() == ['observed_property', 'sampling_medium', 'statistic']
+    catalog.find_attribute_mappings.assert_called_once_with('Alpha', None, None, False)
+
+
+def test_plugin_access_datasource_vocab_cached():
+    """Test that datasource vocabulary mapping lookups are only searched for once in the catalog"""
+    from basin3d.core.models import DataSource
+    from basin3d.core.plugin import DataSourcePluginAccess
+
+    catalog = Mock()
+    catalog.find_datasource_attribute_mapping.return_value = 'mapping'
+    plugin_access = DataSourcePluginAccess(DataSource(id='Alpha', id_prefix='A'), catalog)
+
+    for _ in range(2):
+        assert plugin_access.get_datasource_attribute_mapping('STATISTIC', 'mean') == 'mapping'
+    catalog.find_datasource_attribute_mapping.assert_called_once_with('Alpha', 'STATISTIC', 'mean')
+
+    # the lookup is searched for again once the cache is cleared
+    plugin_access.clear_attribute_mapping_cache()
+    catalog.find_datasource_attribute_mapping.return_value = 'new mapping'
+    assert plugin_access.get_datasource_attribute_mapping('STATISTIC', 'mean') == 'new mapping'
+    assert catalog.find_datasource_attribute_mapping.call_count == 2
+
+
+def test_plugin_access_datasource_vocab_cache_bounded(monkeypatch):
+    """Test that only the most recently used datasource vocabulary mapping lookups are cached"""
+    from basin3d.core.models import DataSource
+    from basin3d.core.plugin import DataSourcePluginAccess
+
+    monkeypatch.setattr(DataSourcePluginAccess, 'attribute_mapping_cache_size', 2)
+    catalog = Mock()
+    catalog.find_datasource_attribute_mapping.side_effect = lambda *args: args[2]
+    plugin_access = DataSourcePluginAccess(DataSource(id='Alpha', id_prefix='A'), catalog)
+
+    for vocab in ['mean', 'min', 'max', 'unmapped', 'mean']:
+        assert plugin_access.get_datasource_attribute_mapping('STATISTIC', vocab) == vocab
+
+    assert catalog.find_datasource_attribute_mapping.call_count == 5
+    assert list(plugin_access._datasource_attribute_mappings) == [('STATISTIC', 'unmapped'), ('STATISTIC', 'mean')]
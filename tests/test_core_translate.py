@@ -169,6 +169,30 @@ def test_translator_translate_mapped_query_attrs(ds, query, expected_results, se
     assert results == expected_results
 
 
+def test_translator_translate_attributes():
+    """Test that attributes set from a compound mapping are not translated a second time"""
+    kwargs = translate.translate_attributes(complex_plugin_access(), ['observed_property', 'sampling_medium', 'statistic'],
+                                            observed_property='Mean acetate', id='C-1')
+    assert kwargs['id'] == 'C-1'
+    for attr in ['observed_property', 'sampling_medium', 'statistic']:
+        assert kwargs[attr].datasource_vocab == 'Mean acetate'
+        assert kwargs[attr].basin3d_vocab == 'ACT:WATER:MEAN'
+
+
+@pytest.mark.parametrize('query, expected_result',
+                         [(QueryMeasurementTimeseriesTVP(observed_property=['Ag'], start_date='2019-01-01', monitoring_feature=['A-3']), True),
+                          (QueryMeasurementTimeseriesTVP(observed_property=['Ag'], start_date='2019-01-01', monitoring_feature=['F-3']), False),
+                          (QueryMonitoringFeature(id='A-1', parent_feature=['F-3']), False),
+                          (QueryMonitoringFeature(id='F-1'), True),
+                          (QueryMonitoringFeature(parent_feature=[]), True),
+                          (QueryMonitoringFeature(monitoring_feature=[]), True)],
+                         ids=['datasource-values', 'no-datasource-values', 'no-datasource-values-optional', 'not-supported-id',
+                              'empty-list-optional', 'empty-list'])
+def test_translator_has_datasource_values(query, expected_result):
+    translated_query = translate.translate_query(alpha_plugin_access(), query)
+    assert translate.has_datasource_values(query, translated_query) is expected_result
+
+
 def test_translator_order_mapped_fields():
     ordered_fields = translate._order_mapped_fields(alpha_plugin_access(), ['statistic', 'aggregation_duration', 'sampling_medium', 'observed_property'])
     assert ordered_fields == ['observed_property', 'sampling_medium', 'statistic', 'aggregation_duration']
@@ -187,14 +211,32 @@ def test_translator_order_mapped_fields():
                            {'aggregation_duration': NO_MAPPING_TEXT}, False),
                           (QueryMeasurementTimeseriesTVP(observed_property=['Ag'], start_date='2019-01-01', monitoring_feature=['A-3']),
                            {'aggregation_duration': {'key', 'value'}}, None),
+                          (QueryMeasurementTimeseriesTVP(observed_property=['Ag'], start_date='2019-01-01', monitoring_feature=['F-3']),
+                           {'monitoring_feature': []}, True),
                           ],
                          ids=['valid', 'invalid_only-list-not_supported', 'valid-2', 'valid-not-mapped-field',
-                              'invalid-single-not-supported', 'invalid_attr_value_type'])
-def test_translator_is_translated_query_valid(query, set_translated_attr, expected_result):
+                              'invalid-single-not-supported', 'invalid_attr_value_type', 'valid-no-prefixed-values'])
+def test_translator_validate_query(query, set_translated_attr, expected_result):
+    translated_query = query.copy()
+    for attr, value in set_translated_attr.items():
+        setattr(translated_query, attr, value)
+    assert translate._validate_and_clean_query('Alpha', query, translated_query) is expected_result
+
+
+@pytest.mark.parametrize('set_translated_attr, expected_result, set_cleaned_query_attr',
+                         [({'observed_property': ['Ag', NO_MAPPING_TEXT, 'Ag']}, True, {'observed_property': ['Ag']}),
+                          ({'observed_property': [NO_MAPPING_TEXT]}, False, {'observed_property': [NO_MAPPING_TEXT]})],
+                         ids=['valid-cleaned', 'invalid-not-cleaned'])
+def test_translator_validate_and_clean_query(set_translated_attr, expected_result, set_cleaned_query_attr):
+    query = QueryMeasurementTimeseriesTVP(observed_property=['Ag'], start_date='2019-01-01', monitoring_feature=['A-3'])
     translated_query = query.copy()
+    cleaned_query = query.copy()
     for attr, value in set_translated_attr.items():
         setattr(translated_query, attr, value)
-    assert translate._is_translated_query_valid('Alpha', query, translated_query) is expected_result
+    for attr, value in set_cleaned_query_attr.items():
+        setattr(cleaned_query, attr, value)
+    assert translate._validate_and_clean_query('Alpha', query, translated_query) is expected_result
+    assert translated_query == cleaned_query
 
 
 @pytest.mark.parametrize("query, set_translated_attr",
@@ -206,8 +248,10 @@ def test_translator_is_translated_query_valid(query, set_translated_attr, expect
                            {'monitoring_feature': []}),
                           (QueryMonitoringFeature(monitoring_feature=['A-9237', 'R-8e3838'], parent_feature=['A-00000'], id='A-345aa'),
                            {'monitoring_feature': ['9237'], 'parent_feature': ['00000'], 'id': '345aa'}),
+                          (QueryMonitoringFeature(id='R-345aa'),
+                           {'id': NO_MAPPING_TEXT}),
                           ],
-                         ids=["single", "multiple", "none", "monitoring_feature_query"])
+                         ids=["single", "multiple", "none", "monitoring_feature_query", "other_datasource_id"])
 def test_translator_prefixed_query_attrs(query, set_translated_attr):
     """Filtering of query arguments"""
     translated_query = query.copy()
@@ -223,15 +267,19 @@ def test_translator_prefixed_query_attrs(query, set_translated_attr):
                            {}, {'observed_property': ['Ag']}),
                           (QueryMeasurementTimeseriesTVP(monitoring_feature=['A-9237'], observed_property=[NO_MAPPING_TEXT, NO_MAPPING_TEXT], start_date='2019-01-01'),
                            {}, {'observed_property': []}),
+                          (QueryMeasurementTimeseriesTVP(monitoring_feature=['A-9237'], observed_property=['Ag', 'Al', NO_MAPPING_TEXT, 'Ag', 'Acetate'], start_date='2019-01-01'),
+                           {}, {'observed_property': ['Ag', 'Al', 'Acetate']}),
                           (QueryMeasurementTimeseriesTVP(monitoring_feature=['A-9237'], observed_property=['Ag'], start_date='2019-01-01'),
                            {'observed_property': NO_MAPPING_TEXT}, {'observed_property': None}),
                           ],
-                         ids=['no-change', 'rm-one-list', 'rm-all-list', 'rm-string'])
-def test_translator_clean_query(query, set_translated_attr, set_cleaned_query_attr):
+                         ids=['no-change', 'rm-one-list', 'rm-all-list', 'rm-duplicates-ordered', 'rm-string'])
+def test_translator_clean_query_attr(query, set_translated_attr, set_cleaned_query_attr):
     translated_query = query.copy()
     cleaned_query = query.copy()
     for attr, value in set_translated_attr.items():
         setattr(translated_query, attr, value)
     for attr, value in set_cleaned_query_attr.items():
         setattr(cleaned_query, attr, value)
-    assert translate._clean_query(translated_query) == cleaned_query
+    for attr in translated_query.mapped_fields:
+        translate._clean_query_attr(translated_query, attr)
+    assert translated_query == cleaned_query
@@ -568,3 +568,23 @@ def test_measurement_timeseries_tvp_observation_bad_response(monkeypatch):
     }
     with pytest.raises(ValidationError):
         synthesizer.measurement_timeseries_tvp_observations(**query)
+
+
+@pytest.mark.parametrize('start_date, start_time, start_time_zone, expected_result',
+                         [('2020-04-01', None, None, '2020-04-01T00:00:00'),
+                          ('2020-04-01', '10:15:00', None, '2020-04-01T10:15:00'),
+                          ('2020-04-01', '10:15:00', 'PST', '2020-04-01T10:15:00-08:00'),
+                          ('2020-04-01', '10:15:00', 'FOO', '2020-04-01T10:15:00')],
+                         ids=['date-only', 'date-time', 'date-time-tz', 'date-time-unknown-tz'])
+def test_parse_epa_timestamp(start_date, start_time, start_time_zone, expected_result):
+    """Test that the EPA timestamps are parsed and cached"""
+    basin3d.plugins.epa._parse_epa_timestamp.cache_clear()
+    for _ in range(2):
+        assert basin3d.plugins.epa._parse_epa_timestamp(start_date, start_time, start_time_zone) == expected_result
+    assert basin3d.plugins.epa._parse_epa_timestamp.cache_info().hits == 1
+
+
+def test_parse_epa_timestamp_invalid():
+    """Test that an EPA timestamp that cannot be parsed raises a ValueError with the timestamp"""
+    with pytest.raises(ValueError, match='2020-04-31 10:15:00'):
+        basin3d.plugins.epa._parse_epa_timestamp('2020-04-31', '10:15:00', None)
@@ -129,6 +129,80 @@ def test_monitoring_features():
         assert monitoring_features is not None
 
 
+def test_monitoring_features_where_context_reset():
+    """Test that the basin3d_where context is reset after each plugin is iterated"""
+    from basin3d.core import monitor
+
+    synthesizer = register(['tests.testplugins.alpha.AlphaSourcePlugin', 'tests.testplugins.complexmap.ComplexmapSourcePlugin'])
+    where = monitor.get_ctx_basin3d_where()
+    wheres = [monitor.get_ctx_basin3d_where() for _ in synthesizer.monitoring_features()]
+
+    assert 'Alpha.MonitoringFeature' in wheres
+    assert monitor.get_ctx_basin3d_where() == where
+
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_monitoring_features_where_context_abandoned_iterator():
+    """Test that dropping a partly consumed iterator does not reset the caller's basin3d_where context"""
+    import contextvars
+    import gc
+    from basin3d.core import monitor
+
+    synthesizer = register(['tests.testplugins.alpha.AlphaSourcePlugin', 'tests.testplugins.complexmap.ComplexmapSourcePlugin'])
+
+    # consumed and dropped in the same context
+    monitoring_features = synthesizer.monitoring_features()
+    assert next(monitoring_features) is not None
+    caller_token = monitor.set_ctx_basin3d_where('caller')
+    del monitoring_features
+    gc.collect()
+    assert monitor.get_ctx_basin3d_where() == 'caller'
+
+    # consumed in another context and dropped in this one
+    monitoring_features = synthesizer.monitoring_features()
+    assert contextvars.copy_context().run(next, monitoring_features) is not None
+    del monitoring_features
+    gc.collect()
+    assert monitor.get_ctx_basin3d_where() == 'caller'
+    monitor.basin3d_where.reset(caller_token)
+
+
+@pytest.mark.parametrize("query", [{"id": "A-1", "parent_feature": ["E-1"]},
+                                   {"id": "A-1", "datasource": ["A"], "parent_feature": ["Z-9"]}],
+                         ids=['other-datasource', 'unknown-datasource'])
+def test_monitoring_features_by_id_other_parent_feature(query):
+    """Test query of single monitoring feature using id with parent features from another datasource"""
+
+    synthesizer = register(['tests.testplugins.alpha.AlphaSourcePlugin', 'tests.testplugins.plugin_error.ErrorSourcePlugin'])
+    result = synthesizer.monitoring_features(**query)
+
+    assert isinstance(result, SynthesisResponse)
+    assert result.data.id == 'A-1'
+    assert result.messages == []
+
+
+def test_monitoring_features_no_datasource_values():
+    """Test that plugins without any of the specified monitoring features are skipped without a message"""
+
+    synthesizer = register(['tests.testplugins.alpha.AlphaSourcePlugin', 'tests.testplugins.plugin_error.ErrorSourcePlugin'])
+    monitoring_features = synthesizer.monitoring_features(monitoring_feature=['A-1'])
+
+    assert [mf.id for mf in monitoring_features] == ['A-1']
+    assert [msg.where for msg in monitoring_features.synthesis_response.messages] == [['Alpha', 'MonitoringFeature']] * 3
+
+
+@pytest.mark.parametrize("query", [{"parent_feature": []}, {"monitoring_feature": []}],
+                         ids=['empty-parent-feature', 'empty-monitoring-feature'])
+def test_monitoring_features_empty_list_values(query):
+    """Test that every plugin is queried when a prefixed field is specified as an empty list"""
+
+    synthesizer = register(['tests.testplugins.alpha.AlphaSourcePlugin', 'tests.testplugins.plugin_error.ErrorSourcePlugin'])
+    monitoring_features = synthesizer.monitoring_features(**query)
+    list(monitoring_features)
+
+    assert ['Error', 'MonitoringFeature'] in [msg.where for msg in monitoring_features.synthesis_response.messages]
+
+
 @pytest.mark.parametrize("query", [{"id": "A-123"}, {"id": "A-123", "feature_type": "region"}],
                          ids=['not-found', 'too-many-for-id'])
 def test_measurement_timeseries_tvp_observation_errors(query):